@@ -3,8 +3,11 @@ Health check endpoints for ML Service.
 """
 
 from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
 import time
 
+from app.services import chat_cache
+
 router = APIRouter()
 
 # Track service start time
@@ -24,10 +27,11 @@ async def health_check():
 @router.get("/health/ready")
 async def readiness_check():
     """Readiness check for kubernetes."""
-    # Check if all components are ready
+    # Check if all components are ready. Reuse the API's engine singleton —
+    # probes fire every few seconds and must not reload schemes each time.
     try:
-        from app.services.rules_engine import RulesEngine
-        engine = RulesEngine()
+        from app.api.schemes import get_rules_engine
+        engine = get_rules_engine()
         schemes_loaded = len(engine.schemes) > 0
     except Exception:
         schemes_loaded = False
@@ -40,17 +44,33 @@ async def readiness_check():
     }
 
 
-@router.get("/metrics")
-async def metrics():
-    """Basic Prometheus-style metrics endpoint."""
-    uptime = time.time() - SERVICE_START_TIME
-    
-    metrics_text = f"""# HELP krishi_ml_uptime_seconds Service uptime in seconds
+# The HELP/TYPE scaffolding never changes; each scrape only formats the
+# dynamic values into the prebuilt template
+_METRICS_TEMPLATE = """# HELP krishi_ml_uptime_seconds Service uptime in seconds
 # TYPE krishi_ml_uptime_seconds gauge
 krishi_ml_uptime_seconds {uptime:.2f}
 
 # HELP krishi_ml_health Service health status (1=healthy, 0=unhealthy)
 # TYPE krishi_ml_health gauge
 krishi_ml_health 1
+
+# HELP krishi_ml_chat_cache_hits_total Chat responses served from cache
+# TYPE krishi_ml_chat_cache_hits_total counter
+krishi_ml_chat_cache_hits_total {cache_hits}
+
+# HELP krishi_ml_chat_cache_misses_total Chat requests that missed the cache
+# TYPE krishi_ml_chat_cache_misses_total counter
+krishi_ml_chat_cache_misses_total {cache_misses}
 """
-    return metrics_text
+
+
+@router.get("/metrics")
+async def metrics():
+    """Basic Prometheus-style metrics endpoint."""
+    body = _METRICS_TEMPLATE.format(
+        uptime=time.time() - SERVICE_START_TIME,
+        cache_hits=chat_cache.stats["hits"],
+        cache_misses=chat_cache.stats["misses"]
+    )
+    # Plain text (not JSON-quoted) with the version Prometheus expects
+    return PlainTextResponse(body, media_type="text/plain; version=0.0.4")
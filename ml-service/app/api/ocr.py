@@ -5,8 +5,8 @@ API routes for OCR processing and document validation.
 from fastapi import APIRouter, HTTPException, UploadFile, File, Form
 from typing import Optional
 from pydantic import BaseModel
+import asyncio
 import logging
-import base64
 
 from app.models.schemas import OCRRequest, OCRResponse, ValidationResponse, ProfileValidation
 from app.services.ocr_service import OCRService
@@ -26,6 +26,19 @@ def get_ocr_service() -> OCRService:
     return _ocr_service
 
 
+def _build_all_fields(fields: dict, confidence: float) -> list:
+    """Expand extracted fields into the per-field response entries."""
+    return [
+        {
+            "field_name": k,
+            "value": v,
+            "confidence": confidence,
+            "bounding_box": None
+        }
+        for k, v in fields.items()
+    ]
+
+
 @router.post("/ocr/process", response_model=OCRResponse)
 async def process_document(request: OCRRequest):
     """
@@ -37,21 +50,16 @@ async def process_document(request: OCRRequest):
     ocr_service = get_ocr_service()
     
     try:
-        result = ocr_service.process_image(
+        # Tesseract is a blocking subprocess call; run it on a worker
+        # thread so concurrent OCR requests overlap instead of serializing
+        # behind the event loop
+        result = await asyncio.to_thread(
+            ocr_service.process_image,
             image_base64=request.image_base64,
             doc_type_hint=request.doc_type_hint
         )
-        
-        # Build response
-        all_fields = [
-            {
-                "field_name": k,
-                "value": v,
-                "confidence": result["ocr_confidence"],
-                "bounding_box": None
-            }
-            for k, v in result["fields"].items()
-        ]
+
+        all_fields = _build_all_fields(result["fields"], result["ocr_confidence"])
         
         return OCRResponse(
             doc_type_guess=result["doc_type_guess"],
@@ -81,22 +89,14 @@ async def upload_and_process(
         # Read file content
         content = await file.read()
         
-        # Process image
-        result = ocr_service.process_image(
+        # Process image off the event loop (see process_document)
+        result = await asyncio.to_thread(
+            ocr_service.process_image,
             image_bytes=content,
             doc_type_hint=doc_type_hint
         )
-        
-        # Build response
-        all_fields = [
-            {
-                "field_name": k,
-                "value": v,
-                "confidence": result["ocr_confidence"],
-                "bounding_box": None
-            }
-            for k, v in result["fields"].items()
-        ]
+
+        all_fields = _build_all_fields(result["fields"], result["ocr_confidence"])
         
         return {
             "filename": file.filename,
@@ -143,7 +143,7 @@ async def validate_document(request: ValidateRequest):
         
         return ValidationResponse(
             overall_match=all_match,
-            validations=[ProfileValidation(**v) for v in validations],
+            validations=[ProfileValidation.model_construct(**v) for v in validations],
             suggestions=suggestions
         )
         
@@ -59,7 +59,7 @@ async def match_schemes(
         
         # Evaluate all schemes against the profile
         # Use provided schemes if available, otherwise fallback to engine defaults
-        dynamic_schemes = [s.dict() for s in request.schemes] if request.schemes else None
+        dynamic_schemes = [s.model_dump() for s in request.schemes] if request.schemes else None
         eligible_results = rules_engine.find_eligible_schemes(request.profile, dynamic_schemes)
         
         # Rank and get top recommendations
@@ -96,22 +96,8 @@ async def list_schemes(
     """
     List all available schemes.
     """
-    schemes = rules_engine.schemes
-    return {
-        "total": len(schemes),
-        "schemes": [
-            {
-                "scheme_id": s.get("scheme_id"),
-                "name": s.get("name"),
-                "name_hi": s.get("name_hi"),
-                "name_mr": s.get("name_mr"),
-                "category": s.get("category"),
-                "max_benefit": s.get("max_benefit"),
-                "description": s.get("description")
-            }
-            for s in schemes
-        ]
-    }
+    # Schemes only change on reload, so the summary is built once and cached
+    return rules_engine.scheme_summaries()
 
 
 @router.get("/schemes/{scheme_id}")
@@ -139,24 +125,31 @@ async def debug_match(
     Returns full trace of all rule evaluations.
     """
     try:
-        dynamic_schemes = [s.dict() for s in request.schemes] if request.schemes else None
+        dynamic_schemes = [s.model_dump() for s in request.schemes] if request.schemes else None
         
         # 1. Rules Evaluation Trace
         results = []
         schemes_to_eval = dynamic_schemes if dynamic_schemes else rules_engine.schemes
-        
-        for scheme in schemes_to_eval:
+
+        # Loop invariants: the document list and engine handles don't
+        # change per scheme
+        doc_names = [d.field_name for d in request.documents] if request.documents else None
+        eligibility_engine = ranking_engine.eligibility_engine
+        hybrid_model = ranking_engine.hybrid_model
+
+        # 3. Hybrid ML Trace — one batched model call for all schemes
+        success_probs = hybrid_model.predict_probability_batch(
+            request.profile, schemes_to_eval
+        )
+
+        for scheme, success_prob in zip(schemes_to_eval, success_probs):
             is_eligible, matched, failing, confidence = rules_engine.evaluate_scheme(scheme, request.profile)
-            
+
             # 2. Eligibility Engine Trace
-            doc_names = [d.field_name for d in request.documents] if request.documents else None
-            e_result = ranking_engine.eligibility_engine.calculate_score(
+            e_result = eligibility_engine.calculate_score(
                 scheme, request.profile, matched, failing, doc_names
             )
-            
-            # 3. Hybrid ML Trace
-            success_prob = ranking_engine.hybrid_model.predict_probability(request.profile, scheme)
-            
+
             results.append({
                 "scheme_id": scheme.get('scheme_id'),
                 "name": scheme.get('name'),
@@ -166,8 +159,8 @@ async def debug_match(
                     "matched_count": len(matched),
                     "failed_count": len(failing),
                     "details": {
-                        "matched": [r.dict() for r in matched],
-                        "failing": [r.dict() for r in failing]
+                        "matched": [r.model_dump() for r in matched],
+                        "failing": [r.model_dump() for r in failing]
                     }
                 },
                 "scoring_eval": e_result,
@@ -177,7 +170,7 @@ async def debug_match(
             })
             
         return {
-            "profile": request.profile.dict(),
+            "profile": request.profile.model_dump(),
             "evaluation_trace": results
         }
     except Exception as e:
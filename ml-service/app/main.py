@@ -8,6 +8,21 @@ from fastapi.middleware.cors import CORSMiddleware
 from contextlib import asynccontextmanager
 import logging
 
+# Use uvloop's event loop when available; drop-in asyncio replacement
+try:
+    import uvloop
+    uvloop.install()
+except ImportError:
+    pass
+
+# Serialize responses with orjson when available — C implementation,
+# several times faster than stdlib json on the nested match/OCR payloads
+try:
+    import orjson  # noqa: F401
+    from fastapi.responses import ORJSONResponse as DefaultJSONResponse
+except ImportError:
+    from fastapi.responses import JSONResponse as DefaultJSONResponse
+
 from app.api import schemes, ocr, health, ai_chat
 from app.core.config import settings
 from app.services.rules_engine import RulesEngine
@@ -29,14 +44,18 @@ ranking_engine: RankingEngine = None
 async def lifespan(app: FastAPI):
     """Initialize and cleanup resources."""
     global rules_engine, ranking_engine
-    
+
     logger.info("Loading scheme rules and ML models...")
-    rules_engine = RulesEngine()
-    ranking_engine = RankingEngine()
-    
+    # Warm the per-process singletons the endpoints share before traffic
+    # arrives, so a cold-start burst of concurrent requests can't race the
+    # lazy getters into loading the catalogue and models more than once.
+    rules_engine = schemes.get_rules_engine()
+    ranking_engine = schemes.get_ranking_engine()
+    ocr.get_ocr_service()
+
     logger.info("ML Service initialized successfully")
     yield
-    
+
     logger.info("Shutting down ML Service")
 
 
@@ -44,7 +63,8 @@ app = FastAPI(
     title="KRISHI-AI ML Service",
     description="AI-powered scheme matching, ranking, and OCR for farmers",
     version="1.0.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=DefaultJSONResponse
 )
 
 # CORS middleware
@@ -39,14 +39,10 @@ def train_synthetic_model():
     X[:, 5] = np.random.uniform(0, 1, n_samples) # farmer_type
     X[:, 6] = np.random.uniform(0, 1, n_samples) # docs_count
     
-    # Target eligibility based on heuristic rules
-    y = []
-    for i in range(n_samples):
-        # Higher score means more likely to be eligible
-        score = (X[i, 2] * 2 + X[i, 4] * 2 + X[i, 3] * 1) - (X[i, 0] * 1.5 + X[i, 1] * 1.5)
-        y.append(1 if score > 0 else 0)
-    
-    y = np.array(y)
+    # Target eligibility based on heuristic rules; higher score means
+    # more likely to be eligible
+    score = (X[:, 2] * 2 + X[:, 4] * 2 + X[:, 3] * 1) - (X[:, 0] * 1.5 + X[:, 1] * 1.5)
+    y = (score > 0).astype(int)
     
     logger.info(f"Training on {n_samples} samples (Positive: {sum(y)})...")
     model = LogisticRegression()
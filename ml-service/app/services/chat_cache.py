@@ -0,0 +1,111 @@
+"""
+Two-tier cache for chat responses.
+
+Tier 1 is a small in-process TTL LRU dict. Tier 2 is Redis, used only when
+the optional redis package is installed and REDIS_URL is configured. Both
+tiers fail open: any cache error just falls through to normal handling.
+"""
+
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+import hashlib
+import json
+import logging
+import time
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Optional dependency — the service runs fine without Redis
+try:
+    import redis.asyncio as aioredis
+except ImportError:
+    aioredis = None
+
+CACHE_TTL_SECONDS = 86400
+LOCAL_CACHE_MAX_ENTRIES = 1024
+_KEY_VERSION = "chat:v1"
+
+# key -> (expires_at, response dict), most recently used last
+_local_cache: "OrderedDict[str, Any]" = OrderedDict()
+_redis_client = None
+_redis_disabled = False
+
+# Exposed via /metrics
+stats = {"hits": 0, "misses": 0}
+
+
+def make_key(message: str, language: str, profile: Optional[Dict]) -> str:
+    """Versioned cache key from the normalized message, language and profile."""
+    profile_sig = json.dumps(profile, sort_keys=True, default=str) if profile else ''
+    digest = hashlib.md5(
+        f"{message}|{language}|{profile_sig}".encode('utf-8')
+    ).hexdigest()
+    return f"{_KEY_VERSION}:{digest}:{language}"
+
+
+def _get_redis():
+    global _redis_client, _redis_disabled
+    if _redis_disabled or aioredis is None or not settings.redis_url:
+        return None
+    if _redis_client is None:
+        try:
+            _redis_client = aioredis.from_url(settings.redis_url)
+        except Exception as e:
+            logger.warning(f"Chat cache: Redis unavailable, running single-tier: {e}")
+            _redis_disabled = True
+            return None
+    return _redis_client
+
+
+async def get_cached_chat(key: str) -> Optional[Dict]:
+    """Return a cached response dict, or None on miss. Never raises."""
+    global _redis_disabled
+
+    entry = _local_cache.get(key)
+    if entry is not None:
+        expires_at, response = entry
+        if expires_at > time.time():
+            _local_cache.move_to_end(key)
+            stats["hits"] += 1
+            return response
+        del _local_cache[key]
+
+    client = _get_redis()
+    if client is not None:
+        try:
+            raw = await client.get(key)
+            if raw is not None:
+                response = json.loads(raw)
+                _store_local(key, response, CACHE_TTL_SECONDS)
+                stats["hits"] += 1
+                return response
+        except Exception as e:
+            logger.warning(f"Chat cache: Redis read failed, disabling tier 2: {e}")
+            _redis_disabled = True
+
+    stats["misses"] += 1
+    return None
+
+
+async def cache_chat(key: str, response: Dict, ttl: int = CACHE_TTL_SECONDS):
+    """Store a response dict in both tiers, best effort."""
+    global _redis_disabled
+
+    _store_local(key, response, ttl)
+
+    client = _get_redis()
+    if client is not None:
+        try:
+            await client.set(key, json.dumps(response), ex=ttl)
+        except Exception as e:
+            logger.warning(f"Chat cache: Redis write failed, disabling tier 2: {e}")
+            _redis_disabled = True
+
+
+def _store_local(key: str, response: Dict, ttl: int):
+    _local_cache[key] = (time.time() + ttl, response)
+    _local_cache.move_to_end(key)
+    while len(_local_cache) > LOCAL_CACHE_MAX_ENTRIES:
+        _local_cache.popitem(last=False)
@@ -32,6 +32,22 @@ class EligibilityScoringEngine:
         "special": 0.05
     }
 
+    # Map fields to categories for weighting; frozensets give O(1)
+    # membership checks and the mapping never changes per call
+    CATEGORIES = {
+        "land": frozenset({"acreage", "land_area", "land_type"}),
+        "income": frozenset({"income", "annual_income"}),
+        "crop": frozenset({"crops", "main_crops"}),
+        "location": frozenset({"state", "district", "village"}),
+        "farmentype": frozenset({"farmer_type"}),
+        "documents": frozenset(), # Handled separately
+        "special": frozenset({
+            "irrigation_available", "caste_category", "livestock",
+            "soil_type", "water_source", "machinery_owned", "education_level",
+            "bank_account_linked", "aadhaar_linked", "loan_status"
+        })
+    }
+
     def calculate_score(
         self, 
         scheme: Dict[str, Any], 
@@ -43,36 +59,26 @@ class EligibilityScoringEngine:
         """
         Calculates a weighted eligibility score.
         """
-        # Map fields to categories for weighting
-        categories = {
-            "land": ["acreage", "land_area", "land_type"],
-            "income": ["income", "annual_income"],
-            "crop": ["crops", "main_crops"],
-            "location": ["state", "district", "village"],
-            "farmentype": ["farmer_type"],
-            "documents": [], # Handled separately
-            "special": [
-                "irrigation_available", "caste_category", "livestock", 
-                "soil_type", "water_source", "machinery_owned", "education_level",
-                "bank_account_linked", "aadhaar_linked", "loan_status"
-            ]
-        }
-        
         cat_scores = {}
         all_rules = matched_rules + failing_rules
-        
+        # Lowercase each rule field once instead of once per category
+        rule_fields = [(r.field.lower(), r.passed) for r in all_rules]
+
         # Helper to get score for a category
         def get_cat_score(category_fields):
-            cat_rules = [r for r in all_rules if r.field.lower() in category_fields]
-            if not cat_rules:
+            cat_total = cat_passed = 0
+            for field_lower, passed in rule_fields:
+                if field_lower in category_fields:
+                    cat_total += 1
+                    if passed:
+                        cat_passed += 1
+            if not cat_total:
                 return 1.0 # Default to full pass if no rules for this category
-            
-            passed_cat = [r for r in cat_rules if r.passed]
-            return len(passed_cat) / len(cat_rules)
+            return cat_passed / cat_total
 
         # Calculate scores for core rule categories
         for cat in ["land", "income", "crop", "location", "farmentype", "special"]:
-            cat_scores[cat] = get_cat_score(categories[cat])
+            cat_scores[cat] = get_cat_score(self.CATEGORIES[cat])
 
         # Document readiness (10%)
         required_docs = scheme.get('required_documents', [])
@@ -6,11 +6,27 @@ import os
 import joblib
 import logging
 import numpy as np
+from enum import Enum
+from functools import lru_cache
 from typing import List, Dict, Any, Optional
 from app.models.schemas import FarmerProfile
 
 logger = logging.getLogger(__name__)
 
+
+@lru_cache(maxsize=None)
+def _load_model(model_path: str):
+    """Load the pickled model once per path; instances share the result."""
+    try:
+        if os.path.exists(model_path):
+            return joblib.load(model_path)
+        logger.warning(f"Model not found at {model_path}. Using rules-only fallback.")
+        return None
+    except Exception as e:
+        logger.error(f"Error loading model: {e}")
+        return None
+
+
 class HybridModel:
     """
     Hybrid model for scheme eligibility prediction.
@@ -21,47 +37,59 @@ class HybridModel:
         self.model_path = model_path or os.path.join(
             os.path.dirname(__file__), "..", "..", "models", "eligibility_model.pkl"
         )
-        self.model = self._load_model()
-        
-    def _load_model(self):
-        try:
-            if os.path.exists(self.model_path):
-                return joblib.load(self.model_path)
-            logger.warning(f"Model not found at {self.model_path}. Using rules-only fallback.")
-            return None
-        except Exception as e:
-            logger.error(f"Error loading model: {e}")
-            return None
+        self.model = _load_model(self.model_path)
 
-    def _prepare_features(self, profile: FarmerProfile, scheme: Dict) -> np.ndarray:
+    F_TYPE_MAP = {"owner": 1.0, "tenant": 0.5, "sharecropper": 0.3}
+
+    def _profile_constants(self, profile: FarmerProfile) -> tuple:
         """
-        Creates feature vector: [land_size, income, crop_match, irrigation, state_match, farmer_type, docs_count]
+        Feature inputs that depend only on the profile, computed once so the
+        per-scheme row builder doesn't redo them for every scheme.
         """
         # Feature 1: Land size (normalized)
         land_size = float(profile.acreage) / 10.0
-        
+
         # Feature 2: Income (normalized)
         income = float(profile.annual_income) / 1000000.0
-        
-        # Feature 3: Crop Match (0 or 1)
-        scheme_crops = scheme.get('main_crops', []) or []
-        crop_match = 1.0 if not scheme_crops or any(c in scheme_crops for c in profile.main_crops) else 0.0
-        
+
         # Feature 4: Irrigation (0 or 1)
         irrigation = 1.0 if profile.irrigation_available else 0.0
-        
+
+        # Feature 6: Farmer Type
+        f_type = profile.farmer_type
+        if isinstance(f_type, Enum):
+            f_type = f_type.value
+        farmer_type = self.F_TYPE_MAP.get(f_type, 0.0)
+
+        state_lower = profile.state.lower()
+        profile_crops = set(profile.main_crops)
+
+        return land_size, income, irrigation, farmer_type, state_lower, profile_crops
+
+    def _feature_row(self, scheme: Dict, constants: tuple) -> List[float]:
+        """
+        Creates feature row: [land_size, income, crop_match, irrigation, state_match, farmer_type, docs_count]
+        """
+        land_size, income, irrigation, farmer_type, state_lower, profile_crops = constants
+
+        # Feature 3: Crop Match (0 or 1)
+        scheme_crops = scheme.get('main_crops', []) or []
+        crop_match = 1.0 if not scheme_crops or not profile_crops.isdisjoint(scheme_crops) else 0.0
+
         # Feature 5: State Match (0 or 1)
         scheme_state = scheme.get('state')
-        state_match = 1.0 if not scheme_state or profile.state.lower() == scheme_state.lower() else 0.0
-        
-        # Feature 6: Farmer Type
-        f_type_map = {"owner": 1.0, "tenant": 0.5, "sharecropper": 0.3}
-        farmer_type = f_type_map.get(profile.farmer_type.value if hasattr(profile.farmer_type, 'value') else profile.farmer_type, 0.0)
-        
+        state_match = 1.0 if not scheme_state or state_lower == scheme_state.lower() else 0.0
+
         # Feature 7: Docs Count
         docs_count = len(scheme.get('required_documents', [])) / 5.0
-        
-        return np.array([land_size, income, crop_match, irrigation, state_match, farmer_type, docs_count]).reshape(1, -1)
+
+        return [land_size, income, crop_match, irrigation, state_match, farmer_type, docs_count]
+
+    def _prepare_features(self, profile: FarmerProfile, scheme: Dict) -> np.ndarray:
+        """
+        Creates feature vector: [land_size, income, crop_match, irrigation, state_match, farmer_type, docs_count]
+        """
+        return np.array(self._feature_row(scheme, self._profile_constants(profile))).reshape(1, -1)
 
     def predict_probability(self, profile: FarmerProfile, scheme: Dict) -> float:
         """
@@ -69,7 +97,7 @@ class HybridModel:
         """
         if self.model is None:
             return 0.5 # Default middle probability if model fails
-            
+
         try:
             X = self._prepare_features(profile, scheme)
             # Some models might not have predict_proba if not calibrated
@@ -81,3 +109,30 @@ class HybridModel:
         except Exception as e:
             logger.error(f"ML prediction error: {e}")
             return 0.5
+
+    def predict_probability_batch(
+        self, profile: FarmerProfile, schemes: List[Dict]
+    ) -> List[float]:
+        """
+        Predict eligibility probabilities for all schemes in one model call.
+
+        Stacks the per-scheme feature rows into an (N, 7) matrix so the model
+        runs once instead of once per scheme. Falls back to 0.5 for every
+        scheme on failure, matching predict_probability.
+        """
+        if not schemes:
+            return []
+        if self.model is None:
+            return [0.5] * len(schemes)
+
+        try:
+            constants = self._profile_constants(profile)
+            X = np.array([self._feature_row(s, constants) for s in schemes])
+            if hasattr(self.model, "predict_proba"):
+                probs = self.model.predict_proba(X)[:, 1] # Probability of class 1
+            else:
+                probs = self.model.predict(X)
+            return [float(p) for p in probs]
+        except Exception as e:
+            logger.error(f"ML batch prediction error: {e}")
+            return [0.5] * len(schemes)
@@ -2,17 +2,82 @@
 Ranking Engine for ML-based scheme scoring and recommendation.
 """
 
+import heapq
 import logging
+from functools import lru_cache
 from typing import List, Dict, Any
 from app.models.schemas import (
     FarmerProfile, SchemeRecommendation, RuleMatch, DocumentFields
 )
 from app.services.eligibility_engine import EligibilityScoringEngine
 from app.services.hybrid_model import HybridModel
+from app.services.rules_engine import EligibilityResult
 import numpy as np
 
+# JIT-compiled scoring loop when numba is installed; the NumPy ufunc
+# expression in _score_batch is the fallback
+try:
+    from app.services.ranking_engine_numba import score_all as _score_all_jit
+except ImportError:
+    _score_all_jit = None
+
 logger = logging.getLogger(__name__)
 
+# Rule fields come from a small fixed vocabulary, so their display labels
+# ("annual_income" -> "Annual Income") are built once and reused instead of
+# re-running replace/title per rule per recommendation
+_FIELD_LABELS: Dict[str, str] = {}
+
+
+def _label(field: str) -> str:
+    """Human-readable label for a rule field, memoized across calls."""
+    label = _FIELD_LABELS.get(field)
+    if label is None:
+        label = _FIELD_LABELS.setdefault(field, field.replace('_', ' ').title())
+    return label
+
+
+@lru_cache(maxsize=4096)
+def _estimate_benefit_core(
+    benefit_type: str,
+    max_benefit: float,
+    per_hectare: float,
+    percentage: float,
+    base_amount: float,
+    acreage: float
+) -> float:
+    """Pure benefit formula, memoized on its scalar inputs.
+
+    Repeated rankings of the same profile against the same catalogue
+    (dashboards, retries) hit the cache instead of recomputing.
+    """
+    if benefit_type == 'per_hectare':
+        return min(per_hectare * acreage, max_benefit)
+    elif benefit_type == 'percentage':
+        return min(base_amount * (percentage / 100), max_benefit)
+    else:
+        return max_benefit
+
+
+@lru_cache(maxsize=4096)
+def _rank_score_core(
+    eligibility_score: float,
+    benefit: float,
+    priority: float,
+    doc_readiness: float,
+    success_prob: float
+) -> float:
+    """Pure weighted-sum rank formula; see _calculate_rank_score."""
+    s1 = 0.35 * eligibility_score
+    benefit_weight = min((benefit / 50000) * 100, 100)
+    s2 = 0.25 * benefit_weight
+    s3 = 0.15 * min(priority * 100, 100)
+    s4 = 0.10 * (doc_readiness * 100)
+    s5 = 0.10 * (success_prob * 100)
+    s6 = 0.05 * 100
+    total_score = s1 + s2 + s3 + s4 + s5 + s6
+    return min(max(round(total_score, 2), 0), 100)
+
 
 class RankingEngine:
     """
@@ -44,44 +109,88 @@ class RankingEngine:
         0.10 * success_probability
         0.05 * recency_weight
         """
-        # 1. Eligibility (0.35)
-        s1 = 0.35 * eligibility_score
-        
-        # 2. Benefit Weight (0.25)
         benefit = self._estimate_benefit(scheme, profile)
-        benefit_weight = min((benefit / 50000) * 100, 100)
-        s2 = 0.25 * benefit_weight
-        
-        # 3. Priority Weight (0.15)
-        priority = float(scheme.get('priority_weight', 1.0)) * 100
-        s3 = 0.15 * min(priority, 100)
-        
-        # 4. Document Readiness (0.10)
-        s4 = 0.10 * (doc_readiness * 100)
-        
-        # 5. Success Probability (0.10)
-        s5 = 0.10 * (success_prob * 100)
-        
-        # 6. Recency Weight (0.05) - Default 1.0 for now
-        s6 = 0.05 * 100
-        
-        total_score = s1 + s2 + s3 + s4 + s5 + s6
-        return min(max(round(total_score, 2), 0), 100)
+        return _rank_score_core(
+            eligibility_score,
+            benefit,
+            float(scheme.get('priority_weight', 1.0)),
+            doc_readiness,
+            success_prob
+        )
     
+    def _score_batch(
+        self,
+        results: List[EligibilityResult],
+        profile: FarmerProfile,
+        eligibility_scores: List[float],
+        doc_readiness: List[float],
+        success_probs: List[float]
+    ):
+        """
+        Vectorized benefit and rank-score computation across all schemes.
+
+        Gathers the per-scheme numeric inputs into 1-D arrays once and runs
+        the _calculate_rank_score / _estimate_benefit formulas as a handful
+        of ufunc calls instead of Python arithmetic per scheme.
+        """
+        n = len(results)
+        schemes = [r.scheme for r in results]
+
+        max_benefit = np.fromiter(
+            (s.get('max_benefit', 10000) for s in schemes), dtype=np.float64, count=n)
+        priority = np.fromiter(
+            (float(s.get('priority_weight', 1.0)) for s in schemes), dtype=np.float64, count=n)
+        # benefit_type encoded fixed=0 / per_hectare=1 / percentage=2
+        type_code = np.fromiter(
+            (1 if s.get('benefit_type', 'fixed') == 'per_hectare'
+             else 2 if s.get('benefit_type', 'fixed') == 'percentage' else 0
+             for s in schemes), dtype=np.int8, count=n)
+        per_hectare = np.fromiter(
+            (s.get('benefit_per_hectare', 5000) for s in schemes), dtype=np.float64, count=n)
+        percentage = np.fromiter(
+            (s.get('benefit_percentage', 50) for s in schemes), dtype=np.float64, count=n)
+        base_amount = np.fromiter(
+            (s.get('base_amount', 10000) for s in schemes), dtype=np.float64, count=n)
+
+        benefit = np.where(
+            type_code == 1,
+            np.minimum(per_hectare * profile.acreage, max_benefit),
+            np.where(
+                type_code == 2,
+                np.minimum(base_amount * (percentage / 100), max_benefit),
+                max_benefit
+            )
+        )
+
+        # Same terms and operation order as _calculate_rank_score
+        elig = np.asarray(eligibility_scores, dtype=np.float64)
+        doc = np.asarray(doc_readiness, dtype=np.float64)
+        succ = np.asarray(success_probs, dtype=np.float64)
+        if _score_all_jit is not None:
+            rank = _score_all_jit(elig, benefit, priority, doc, succ)
+        else:
+            rank = (
+                0.35 * elig
+                + 0.25 * np.minimum((benefit / 50000) * 100, 100)
+                + 0.15 * np.minimum(priority * 100, 100)
+                + 0.10 * (doc * 100)
+                + 0.10 * (succ * 100)
+                + 0.05 * 100  # recency weight, default 1.0
+            )
+        rank = np.clip(np.round(rank, 2), 0, 100)
+
+        return benefit, rank
+
     def _estimate_benefit(self, scheme: Dict, profile: FarmerProfile) -> float:
         """Estimate the monetary benefit for this profile."""
-        max_benefit = scheme.get('max_benefit', 10000)
-        benefit_type = scheme.get('benefit_type', 'fixed')
-        
-        if benefit_type == 'per_hectare':
-            per_hectare = scheme.get('benefit_per_hectare', 5000)
-            return min(per_hectare * profile.acreage, max_benefit)
-        elif benefit_type == 'percentage':
-            percentage = scheme.get('benefit_percentage', 50)
-            base_amount = scheme.get('base_amount', 10000)
-            return min(base_amount * (percentage / 100), max_benefit)
-        else:
-            return max_benefit
+        return _estimate_benefit_core(
+            scheme.get('benefit_type', 'fixed'),
+            scheme.get('max_benefit', 10000),
+            scheme.get('benefit_per_hectare', 5000),
+            scheme.get('benefit_percentage', 50),
+            scheme.get('base_amount', 10000),
+            profile.acreage
+        )
     
     def _get_confidence_level(self, confidence: float) -> str:
         """Convert numeric confidence to level."""
@@ -117,9 +226,9 @@ class RankingEngine:
                     val_str = ", ".join(str(v) for v in r.expected_value[:3])
                 else:
                     val_str = str(r.expected_value)
-                why.append(f"{r.field.replace('_', ' ').title()} {r.operator} {val_str}")
+                why.append(f"{_label(r.field)} {r.operator} {val_str}")
             elif r.operator in ["<", "<=", ">", ">="] and r.actual_value is not None:
-                why.append(f"{r.field.replace('_', ' ').title()} {r.operator} {r.expected_value} ✓")
+                why.append(f"{_label(r.field)} {r.operator} {r.expected_value} ✓")
             elif r.description:
                 why.append(r.description)
         for r in failing_rules[:2]:  # Limit failing reasons
@@ -135,40 +244,43 @@ class RankingEngine:
     ) -> Dict[str, str]:
         """Generate human-readable explanations in multiple languages."""
         scheme_name = scheme.get('name', 'This scheme')
-        
+        # Format the rupee amount once and reuse it in every language
+        benefit_str = f"₹{benefit:,.0f}"
+        fully_eligible = len(failing_rules) == 0
+
         # English explanation
-        if len(failing_rules) == 0:
+        if fully_eligible:
             en = f"You are fully eligible for {scheme_name}. "
-            en += f"You could receive up to ₹{benefit:,.0f}. "
+            en += f"You could receive up to {benefit_str}. "
             if matched_rules:
                 en += f"Key qualifications: {matched_rules[0].description}"
         elif len(matched_rules) > len(failing_rules):
             en = f"You are partially eligible for {scheme_name}. "
-            en += f"Potential benefit: ₹{benefit:,.0f}. "
+            en += f"Potential benefit: {benefit_str}. "
             en += f"Missing: {failing_rules[0].description}"
         else:
             en = f"Currently not eligible for {scheme_name}. "
             en += f"Main reason: {failing_rules[0].description}"
-        
+
         # Hindi explanation
-        if len(failing_rules) == 0:
+        if fully_eligible:
             hi = f"आप {scheme.get('name_hi', scheme_name)} के लिए पूर्ण रूप से पात्र हैं। "
-            hi += f"आपको ₹{benefit:,.0f} तक मिल सकते हैं।"
+            hi += f"आपको {benefit_str} तक मिल सकते हैं।"
         else:
             hi = f"आप {scheme.get('name_hi', scheme_name)} के लिए आंशिक रूप से पात्र हैं।"
-        
+
         # Marathi explanation
-        if len(failing_rules) == 0:
+        if fully_eligible:
             mr = f"तुम्ही {scheme.get('name_mr', scheme_name)} साठी पूर्णपणे पात्र आहात। "
-            mr += f"तुम्हाला ₹{benefit:,.0f} पर्यंत मिळू शकतात।"
+            mr += f"तुम्हाला {benefit_str} पर्यंत मिळू शकतात।"
         else:
             mr = f"तुम्ही {scheme.get('name_mr', scheme_name)} साठी अंशतः पात्र आहात।"
-        
+
         return {"en": en, "hi": hi, "mr": mr}
     
     def rank_schemes(
         self,
-        eligible_results: List[Dict[str, Any]],
+        eligible_results: List[EligibilityResult],
         profile: FarmerProfile,
         documents: List[DocumentFields] = None,
         top_k: int = 10
@@ -176,32 +288,62 @@ class RankingEngine:
         """
         Rank schemes and return top K recommendations with explainability.
         """
-        recommendations = []
-        
-        for result in eligible_results:
-            scheme = result['scheme']
-            matched_rules = result['matched_rules']
-            failing_rules = result['failing_rules']
-            
-            # Use the new Eligibility Scoring Engine
-            doc_names = [d.field_name for d in documents] if documents else None
-            e_result = self.eligibility_engine.calculate_score(
-                scheme, profile, matched_rules, failing_rules, doc_names
+        if not eligible_results:
+            return []
+
+        # Use the new Eligibility Scoring Engine
+        doc_names = [d.field_name for d in documents] if documents else None
+        e_results = [
+            self.eligibility_engine.calculate_score(
+                result.scheme, profile,
+                result.matched_rules, result.failing_rules, doc_names
             )
-            
-            eligibility_score = e_result['eligibility_score']
-            doc_readiness = e_result['category_scores'].get('documents', 0.5)
-            
-            # Predict success probability using Hybrid ML Model
-            success_prob = self.hybrid_model.predict_probability(profile, scheme)
-            
-            # Calculate final multi-factor rank score
-            rank_score = self._calculate_rank_score(
-                eligibility_score, scheme, profile, doc_readiness, success_prob
+            for result in eligible_results
+        ]
+        eligibility_scores = [e['eligibility_score'] for e in e_results]
+        doc_readiness = [e['category_scores'].get('documents', 0.5) for e in e_results]
+
+        # Predict success probabilities for all schemes in one model call
+        # instead of once per scheme
+        success_probs = self.hybrid_model.predict_probability_batch(
+            profile, [result.scheme for result in eligible_results]
+        )
+
+        # Benefits and multi-factor rank scores for all schemes at once
+        benefits, rank_scores = self._score_batch(
+            eligible_results, profile, eligibility_scores, doc_readiness, success_probs
+        )
+
+        # Pick the top-k winners over indices before building any
+        # recommendation objects: explanations, why arrays and pydantic
+        # assembly then only run for the k schemes that survive, not all N.
+        # nsmallest is stable and O(N log k) against the full sort's
+        # O(N log N).
+        status_order = {"eligible": 0, "partially_eligible": 1}
+        winners = heapq.nsmallest(
+            top_k,
+            range(len(eligible_results)),
+            key=lambda i: (
+                status_order.get(e_results[i]['eligibility_status'], 2),
+                -rank_scores[i]
             )
-            
-            benefit = self._estimate_benefit(scheme, profile)
-            
+        )
+
+        recommendations = []
+        for i in winners:
+            result = eligible_results[i]
+            scheme = result.scheme
+            matched_rules = result.matched_rules
+            failing_rules = result.failing_rules
+
+            e_result = e_results[i]
+            eligibility_score = eligibility_scores[i]
+            # 0-1 scale used by both confidence fields; divide once
+            confidence_ratio = eligibility_score / 100.0
+            success_prob = success_probs[i]
+            rank_score = float(rank_scores[i])
+            benefit = float(benefits[i])
+
             # Generate explanations
             explanations = self._generate_explanation(
                 scheme, matched_rules, failing_rules, benefit
@@ -209,14 +351,16 @@ class RankingEngine:
             
             why_array = self._build_why_array(matched_rules, failing_rules)
 
-            recommendation = SchemeRecommendation(
+            # Built entirely from engine-computed values; model_construct
+            # skips re-validating them on every recommendation
+            recommendation = SchemeRecommendation.model_construct(
                 scheme_id=scheme.get('scheme_id', ''),
                 name=scheme.get('name', ''),
                 name_hi=scheme.get('name_hi'),
                 name_mr=scheme.get('name_mr'),
                 score=rank_score,
                 benefit_estimate=benefit,
-                confidence=self._get_confidence_level(eligibility_score / 100),
+                confidence=self._get_confidence_level(confidence_ratio),
                 matched_rules=matched_rules,
                 failing_rules=failing_rules,
                 why=why_array,
@@ -227,17 +371,8 @@ class RankingEngine:
                 eligibility_status=e_result['eligibility_status'],
                 eligibility_percentage=eligibility_score,
                 success_probability=success_prob,
-                confidence_score=eligibility_score / 100.0
+                confidence_score=confidence_ratio
             )
             recommendations.append(recommendation)
-        
-        # Sort by score (descending) and eligibility
-        recommendations.sort(
-            key=lambda x: (
-                0 if x.eligibility_status == "eligible" else 
-                1 if x.eligibility_status == "partially_eligible" else 2,
-                -x.score
-            )
-        )
-        
-        return recommendations[:top_k]
+
+        return recommendations
@@ -0,0 +1,37 @@
+"""
+Numba-compiled inner loop for the ranking math.
+
+Importing this module requires numba; ranking_engine treats an ImportError
+as "use the pure-NumPy scoring path instead".
+"""
+
+import numpy as np
+from numba import njit
+
+
+@njit(cache=True, fastmath=True)
+def score_all(elig, benefit, priority, doc, success):
+    """
+    Weighted rank sum over preassembled float64 arrays.
+
+    Mirrors _calculate_rank_score term for term; rounding and clamping stay
+    with the caller so both scoring paths share them exactly.
+    """
+    n = elig.shape[0]
+    out = np.empty(n, dtype=np.float64)
+    for i in range(n):
+        benefit_weight = (benefit[i] / 50000.0) * 100.0
+        if benefit_weight > 100.0:
+            benefit_weight = 100.0
+        prio = priority[i] * 100.0
+        if prio > 100.0:
+            prio = 100.0
+        out[i] = (
+            0.35 * elig[i]
+            + 0.25 * benefit_weight
+            + 0.15 * prio
+            + 0.10 * (doc[i] * 100.0)
+            + 0.10 * (success[i] * 100.0)
+            + 5.0  # recency weight, default 1.0
+        )
+    return out
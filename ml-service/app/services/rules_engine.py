@@ -4,16 +4,188 @@ Rules Engine for deterministic scheme eligibility matching.
 
 import yaml
 import os
-from typing import List, Dict, Any, Tuple, Optional
+import time
+import bisect
+import pickle
+from dataclasses import dataclass
+from operator import attrgetter
+from typing import List, Dict, Any, Callable, Tuple, Optional
 from app.models.schemas import FarmerProfile, RuleMatch
 import logging
+from functools import lru_cache
 import psycopg2
 from psycopg2.extras import RealDictCursor
+from psycopg2.pool import ThreadedConnectionPool
 from app.core.config import settings
 import json
+import numpy as np
 
 logger = logging.getLogger(__name__)
 
+# Small shared pool so scheme reloads borrow a connection instead of paying
+# the TCP + auth handshake per load; created lazily on first DB access
+_db_pool: Optional[ThreadedConnectionPool] = None
+
+
+def _get_db_connection():
+    global _db_pool
+    if _db_pool is None:
+        _db_pool = ThreadedConnectionPool(1, 4, settings.database_url)
+    return _db_pool.getconn()
+
+
+def _release_db_connection(conn):
+    """Return a connection to the pool with its transaction state reset."""
+    try:
+        conn.rollback()
+        _db_pool.putconn(conn)
+    except Exception:
+        try:
+            _db_pool.putconn(conn, close=True)
+        except Exception:
+            pass
+
+
+@lru_cache(maxsize=8)
+def _parse_schemes_yaml(path: str, mtime: float) -> tuple:
+    """Parse the schemes YAML once per (path, mtime); reused across engines.
+
+    The lru_cache covers reloads within a process; a pickle written next to
+    the YAML (same approach as the chat search index) lets fresh workers
+    cold-start without paying for the YAML parse at all. The pickle is only
+    trusted while it is at least as new as the source file.
+    """
+    pickle_path = os.path.splitext(path)[0] + '.rules.pkl'
+    try:
+        if os.path.getmtime(pickle_path) >= mtime:
+            with open(pickle_path, 'rb') as f:
+                return tuple(pickle.load(f))
+    except (OSError, pickle.PickleError, EOFError):
+        pass
+
+    with open(path, 'r', encoding='utf-8') as f:
+        # libyaml-backed loader when available; same parse, much faster
+        Loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+        data = yaml.load(f, Loader=Loader)
+    schemes = tuple(data.get('schemes', []))
+
+    try:
+        # Write-then-rename so a concurrent worker never reads a half-written
+        # pickle; os.replace is atomic on the same filesystem
+        tmp_path = pickle_path + '.tmp'
+        with open(tmp_path, 'wb') as f:
+            pickle.dump(list(schemes), f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, pickle_path)
+    except OSError as e:
+        logger.debug(f"Could not write schemes pickle cache: {e}")
+
+    return schemes
+
+
+@dataclass(slots=True)
+class EligibilityResult:
+    """Per-scheme evaluation result returned by find_eligible_schemes.
+
+    Slots keep the per-scheme allocation small and make the ranking
+    engine's field accesses C-level slot loads instead of dict lookups.
+    """
+    scheme: Dict[str, Any]
+    is_eligible: bool
+    matched_rules: List[RuleMatch]
+    failing_rules: List[RuleMatch]
+    confidence: float
+
+
+# Operator ids for _apply_op. Rule expected values are constants, so the
+# str(value).lower() / float(value) normalization the old lambda table did on
+# every evaluation is hoisted to load time (_normalize_expected); evaluation
+# dispatches on a small int instead of looking up and calling a lambda.
+OP_CODES = {
+    "==": 0,
+    "!=": 1,
+    "<": 2,
+    "<=": 3,
+    ">": 4,
+    ">=": 5,
+    "in": 6,
+    "not_in": 7,
+    "contains": 8,
+    "any_in": 9,
+    "equals": 10,  # alias for case-insensitive ==
+}
+
+
+def _normalize_expected(code: int, value: Any) -> Any:
+    """Pre-normalize a rule's expected value for _apply_op.
+
+    Raises for numeric operators with a non-numeric constant, which callers
+    treat the same way the old eval-time float() failure was treated.
+    """
+    if 2 <= code <= 5:
+        return float(value)
+    if code in (8, 10) or (code in (6, 7) and not isinstance(value, list)):
+        return str(value).lower()
+    return value
+
+
+def _apply_op(code: int, a: Any, b: Any) -> bool:
+    """Apply operator `code` to actual value `a` and pre-normalized `b`."""
+    match code:
+        case 0:
+            return a == b
+        case 1:
+            return a != b
+        case 2:
+            return float(a) < b
+        case 3:
+            return float(a) <= b
+        case 4:
+            return float(a) > b
+        case 5:
+            return float(a) >= b
+        case 6:
+            return a in b if isinstance(b, list) else str(a).lower() in b
+        case 7:
+            return a not in b if isinstance(b, list) else str(a).lower() not in b
+        case 8:
+            if isinstance(a, list):
+                return any(b in str(x).lower() for x in a)
+            return b in str(a).lower()
+        case 9:
+            return any(x in b for x in a) if isinstance(a, list) else a in b
+        case 10:
+            return str(a).lower() == b
+    return False
+
+
+# One resolved getter per rule field name, built once at import. Single-rule
+# lookups grab just the field they need instead of materializing the whole
+# 20-field mapping, and the full mapping is a comprehension over this table.
+_FIELD_GETTERS: Dict[str, Callable[[FarmerProfile], Any]] = {
+    "acreage": attrgetter("acreage"),
+    "land_area": attrgetter("acreage"),
+    "income": attrgetter("annual_income"),
+    "annual_income": attrgetter("annual_income"),
+    "family_count": attrgetter("family_count"),
+    "family_size": attrgetter("family_count"),
+    "state": lambda p: p.state.lower(),
+    "district": lambda p: p.district.lower(),
+    "land_type": lambda p: p.land_type.value,
+    "farmer_type": lambda p: p.farmer_type.value,
+    "crops": attrgetter("main_crops"),
+    "main_crops": attrgetter("main_crops"),
+    "education_level": lambda p: p.education_level.lower() if p.education_level else "none",
+    "irrigation_available": attrgetter("irrigation_available"),
+    "loan_status": lambda p: p.loan_status.lower() if p.loan_status else "none",
+    "bank_account_linked": attrgetter("bank_account_linked"),
+    "aadhaar_linked": attrgetter("aadhaar_linked"),
+    "caste_category": lambda p: p.caste_category.lower() if p.caste_category else "general",
+    "livestock": attrgetter("livestock"),
+    "soil_type": lambda p: p.soil_type.lower() if p.soil_type else "unknown",
+    "water_source": lambda p: p.water_source.lower() if p.water_source else "rainfed",
+    "machinery_owned": attrgetter("machinery_owned"),
+}
+
 
 class RulesEngine:
     """
@@ -21,44 +193,470 @@ class RulesEngine:
     Rules are defined in YAML format for easy editing by non-developers.
     """
     
-    OPERATORS = {
-        "==": lambda a, b: a == b,
-        "!=": lambda a, b: a != b,
-        "<": lambda a, b: float(a) < float(b),
-        "<=": lambda a, b: float(a) <= float(b),
-        ">": lambda a, b: float(a) > float(b),
-        ">=": lambda a, b: float(a) >= float(b),
-        "in": lambda a, b: a in b if isinstance(b, list) else str(a).lower() in str(b).lower(),
-        "not_in": lambda a, b: a not in b if isinstance(b, list) else str(a).lower() not in str(b).lower(),
-        "contains": lambda a, b: any(str(b).lower() in str(x).lower() for x in a) if isinstance(a, list) else str(b).lower() in str(a).lower(),
-        "any_in": lambda a, b: any(x in b for x in a) if isinstance(a, list) else a in b,
-        "equals": lambda a, b: str(a).lower() == str(b).lower(), # Add equals as alias and case-insensitive
+    EVAL_CACHE_MAX_ENTRIES = 4096
+    DB_CACHE_TTL_SECONDS = 60.0
+
+    # Numeric rules packed into arrays at compile time: profile slot per
+    # field alias, op code per comparison operator
+    NUMERIC_FIELD_IDS = {
+        "acreage": 0, "land_area": 0,
+        "income": 1, "annual_income": 1,
+        "family_count": 2, "family_size": 2,
     }
+    NUMERIC_OPS = {"==": 0, "!=": 1, "<": 2, "<=": 3, ">": 4, ">=": 5}
+
+    # Fields whose packed categorical comparisons are safe: scalar fields
+    # always carry (pre-lowered) strings in _profile_values, list fields
+    # carry lists of strings. Membership there is plain string equality,
+    # which bit ids reproduce exactly.
+    SCALAR_CAT_FIELDS = frozenset({
+        "state", "district", "land_type", "farmer_type", "education_level",
+        "loan_status", "caste_category", "soil_type", "water_source",
+    })
+    LIST_CAT_FIELDS = frozenset({"crops", "main_crops", "livestock", "machinery_owned"})
     
     def __init__(self, schemes_path: Optional[str] = None):
         """Initialize the rules engine with scheme definitions."""
         self.schemes_path = schemes_path or settings.schemes_data_path
+        self._summary_cache = None
+        # (scheme_id, profile_key) -> evaluate_scheme result, for the
+        # engine's own schemes only; cleared on reload
+        self._eval_cache: Dict[Tuple[str, str], Tuple] = {}
+        # Last successful DB load, its catalogue stamp and fetch time
+        self._db_cache: Optional[List[Dict]] = None
+        self._db_cache_stamp = None
+        self._db_cache_time = 0.0
         self.schemes = self.reload_schemes()
-    
+
     def reload_schemes(self) -> List[Dict]:
         """Reload schemes from DB (primary) or YAML (fallback)."""
         schemes = self._load_schemes_from_db()
         if not schemes:
             logger.warning("Falling back to YAML for schemes")
             schemes = self._load_schemes_from_yaml()
-        
+
         self.schemes = schemes
+        self._summary_cache = None
+        self._eval_cache.clear()
+        self._build_hard_filters()
+        self._build_numeric_prefilters()
+        self._build_quick_rejects()
+        self._compile_rules()
+        self._schemes_by_id = {
+            s['scheme_id']: s for s in schemes if s.get('scheme_id')
+        }
         logger.info(f"Loaded {len(self.schemes)} schemes into RulesEngine")
         return schemes
+
+    def _build_hard_filters(self):
+        """Index each scheme's top-level state rule, if it has one.
+
+        A failing state rule under AND logic makes the scheme ineligible no
+        matter what, so it can gate the full rule evaluation. Only flat
+        top-level rules qualify — nested groups keep full evaluation. The
+        rule is pre-resolved to (op_code, normalized value, RuleMatch
+        template) here so the per-request gate is one _apply_op call, and a
+        gated scheme can still report its failing rule.
+        """
+        self._hard_state_rules = {}
+        for pos, scheme in enumerate(self.schemes):
+            if str(scheme.get('rules_logic', 'AND')).upper() != 'AND':
+                continue
+            for rule in scheme.get('rules') or []:
+                if 'conditions' in rule:
+                    continue
+                if str(rule.get('field', '')).lower() == 'state':
+                    op_code = OP_CODES.get(rule.get('operator', '=='))
+                    expected_norm = None
+                    if op_code is not None:
+                        try:
+                            expected_norm = _normalize_expected(op_code, rule.get('value'))
+                        except (TypeError, ValueError):
+                            # Can never pass, same as the eval-time failure
+                            op_code = None
+                    self._hard_state_rules[pos] = (
+                        op_code, expected_norm, self._gate_template(rule)
+                    )
+                    break
+
+    @staticmethod
+    def _gate_template(rule: Dict) -> RuleMatch:
+        """Failing-rule template for a gate, cloned per gated result."""
+        field = rule.get('field', '')
+        operator = rule.get('operator', '==')
+        expected_value = rule.get('value')
+        return RuleMatch.model_construct(
+            rule_id=rule.get('id', f"{field}_{operator}"),
+            field=field,
+            operator=operator,
+            expected_value=expected_value,
+            actual_value=None,
+            passed=False,
+            description=rule.get('description', f"{field} {operator} {expected_value}")
+        )
+
+    # Gate field preference, most selective first. State has its own
+    # dedicated gate, so the quick reject covers the next-best fields.
+    QUICK_REJECT_FIELDS = ("caste_category", "farmer_type", "land_type")
+
+    def _build_quick_rejects(self):
+        """Pick one decisive categorical gate per scheme, if it has one.
+
+        Same contract as the hard state rule: under AND logic a failing
+        top-level categorical equality/membership rule decides
+        ineligibility outright, so one pre-resolved _apply_op call can
+        reject the scheme before any rule walk. Stored as
+        (field, op_code, normalized value, RuleMatch template) per scheme
+        position.
+        """
+        self._quick_rejects = {}
+        for pos, scheme in enumerate(self.schemes):
+            if str(scheme.get('rules_logic', 'AND')).upper() != 'AND':
+                continue
+            candidates = {}
+            for rule in scheme.get('rules') or []:
+                if 'conditions' in rule:
+                    continue
+                field_lower = str(rule.get('field', '')).lower()
+                if (field_lower not in self.QUICK_REJECT_FIELDS
+                        or field_lower in candidates):
+                    continue
+                op_code = OP_CODES.get(rule.get('operator', '=='))
+                if op_code not in (6, 7, 10):
+                    continue
+                try:
+                    expected_norm = _normalize_expected(op_code, rule.get('value'))
+                except (TypeError, ValueError):
+                    continue
+                candidates[field_lower] = (
+                    field_lower, op_code, expected_norm, self._gate_template(rule)
+                )
+            for field_lower in self.QUICK_REJECT_FIELDS:
+                if field_lower in candidates:
+                    self._quick_rejects[pos] = candidates[field_lower]
+                    break
+
+    def _build_numeric_prefilters(self):
+        """Bucket schemes by their top-level numeric thresholds.
+
+        Like the hard state rule, a failing top-level acreage/income/family
+        bound under AND logic decides ineligibility outright. Sorting the
+        thresholds lets a bisect per (field, operator) bucket find every
+        scheme the profile's value disqualifies without evaluating any of
+        their rules. Each entry keeps its (field, RuleMatch template) so a
+        gated scheme can still report the decisive bound.
+        """
+        buckets = {}
+        for pos, scheme in enumerate(self.schemes):
+            if str(scheme.get('rules_logic', 'AND')).upper() != 'AND':
+                continue
+            for rule in scheme.get('rules') or []:
+                if 'conditions' in rule:
+                    continue
+                field_lower = str(rule.get('field', '')).lower()
+                slot = self.NUMERIC_FIELD_IDS.get(field_lower)
+                operator = rule.get('operator')
+                if slot is None or operator not in ('<', '<=', '>', '>='):
+                    continue
+                try:
+                    threshold = float(rule.get('value'))
+                except (TypeError, ValueError):
+                    continue
+                buckets.setdefault((slot, operator), []).append(
+                    (threshold, pos, (field_lower, self._gate_template(rule)))
+                )
+
+        self._numeric_buckets = {
+            key: ([t for t, _, _ in entries],
+                  [p for _, p, _ in entries],
+                  [g for _, _, g in entries])
+            for key, entries in (
+                (k, sorted(v, key=lambda e: (e[0], e[1]))) for k, v in buckets.items()
+            )
+        }
+
+    def _numeric_disqualified(
+        self, profile: FarmerProfile
+    ) -> Dict[int, Tuple[str, RuleMatch]]:
+        """Schemes a profile's numeric values rule out, keyed by position.
+
+        Values are the (field, RuleMatch template) of the decisive failing
+        bound — the first one found when several disqualify a scheme.
+        """
+        disqualified = {}
+        if not self._numeric_buckets:
+            return disqualified
+        values = (
+            float(profile.acreage),
+            float(profile.annual_income),
+            float(profile.family_count),
+        )
+        for (slot, operator), (keys, positions, gates) in self._numeric_buckets.items():
+            actual = values[slot]
+            if operator == '<=':    # rule fails when threshold < actual
+                failing = slice(None, bisect.bisect_left(keys, actual))
+            elif operator == '<':   # fails when threshold <= actual
+                failing = slice(None, bisect.bisect_right(keys, actual))
+            elif operator == '>=':  # fails when threshold > actual
+                failing = slice(bisect.bisect_right(keys, actual), None)
+            else:                   # '>' fails when threshold >= actual
+                failing = slice(bisect.bisect_left(keys, actual), None)
+            for pos, gate in zip(positions[failing], gates[failing]):
+                disqualified.setdefault(pos, gate)
+        return disqualified
+
+    def _compile_rules(self):
+        """Pre-resolve each flat scheme's rules into evaluation tuples.
+
+        Rule dicts cost ~5 .get() calls plus an operator-dict lookup every
+        evaluation; resolving them once per reload leaves only the profile
+        lookup and the comparison on the hot path. Schemes with nested
+        condition groups or unknown operators keep the general evaluator.
+        """
+        self._compiled_by_id = {}
+        num_fields, num_ops, num_thresholds = [], [], []
+        # Per-field bit registries for categorical membership rules:
+        # every distinct value gets one bit, so "state in [...]" collapses
+        # to a bitwise AND between the profile's bit and the rule's mask
+        self._cat_slots: Dict[str, int] = {}
+        self._cat_registries: List[Dict[str, int]] = []
+        for scheme in self.schemes:
+            rules = scheme.get('rules') or []
+            compiled = []
+            for rule in rules:
+                if 'conditions' in rule:
+                    compiled = None
+                    break
+                field = rule.get('field', '')
+                operator = rule.get('operator', '==')
+                op_code = OP_CODES.get(operator)
+                if op_code is None:
+                    compiled = None
+                    break
+                expected_value = rule.get('value')
+                try:
+                    expected_norm = _normalize_expected(op_code, expected_value)
+                except (TypeError, ValueError):
+                    # Malformed constant (e.g. non-numeric threshold); the
+                    # general evaluator reports the failure per evaluation
+                    compiled = None
+                    break
+                num_idx = self._pack_numeric_rule(
+                    field.lower(), operator, expected_value,
+                    num_fields, num_ops, num_thresholds
+                )
+                cat = self._pack_categorical_rule(
+                    field.lower(), op_code, expected_value, expected_norm
+                )
+                # Identical predicates repeat across schemes (several test
+                # acreage <= 2, the same state list, ...). A hashable
+                # fingerprint lets one evaluation per request serve them
+                # all; packed rules are already O(1) and skip the memo.
+                fingerprint = None
+                if num_idx is None and cat is None:
+                    try:
+                        fingerprint = (
+                            field.lower(), op_code,
+                            tuple(expected_norm) if isinstance(expected_norm, list)
+                            else expected_norm
+                        )
+                        hash(fingerprint)
+                    except TypeError:
+                        fingerprint = None
+                rule_id = rule.get('id', f"{field}_{operator}")
+                # Template RuleMatch per rule: everything except the actual
+                # value and verdict is static, so evaluation clones the
+                # template via model_copy instead of rebuilding all fields.
+                # The missing-field result is fully static and shared.
+                template = RuleMatch.model_construct(
+                    rule_id=rule_id,
+                    field=field,
+                    operator=operator,
+                    expected_value=expected_value,
+                    actual_value=None,
+                    passed=False,
+                    description=rule.get('description', f"{field} {operator} {expected_value}")
+                )
+                missing = RuleMatch.model_construct(
+                    rule_id=rule_id,
+                    field=field,
+                    operator=operator,
+                    expected_value=expected_value,
+                    actual_value=None,
+                    passed=False,
+                    description=f"Field '{field}' not found in profile"
+                )
+                compiled.append((
+                    field.lower(),
+                    op_code,
+                    expected_norm,
+                    rule_id,
+                    num_idx,
+                    cat,
+                    fingerprint,
+                    template,
+                    missing
+                ))
+            if compiled:
+                self._compiled_by_id[id(scheme)] = compiled
+
+        self._num_field_idx = np.array(num_fields, dtype=np.intp)
+        self._num_ops = np.array(num_ops, dtype=np.intp)
+        self._num_thresholds = np.array(num_thresholds, dtype=np.float64)
+
+    def _pack_numeric_rule(self, field_lower, operator, expected_value,
+                           num_fields, num_ops, num_thresholds):
+        """Append a rule to the numeric arrays if it is safely vectorizable.
+
+        Ordering operators coerce both sides to float like their lambda
+        counterparts. ==/!= compare raw values in OPERATORS, so only
+        genuinely numeric expected values keep identical semantics there.
+        """
+        fid = self.NUMERIC_FIELD_IDS.get(field_lower)
+        opc = self.NUMERIC_OPS.get(operator)
+        if fid is None or opc is None:
+            return None
+        if opc <= 1 and (isinstance(expected_value, bool)
+                         or not isinstance(expected_value, (int, float))):
+            return None
+        try:
+            threshold = float(expected_value)
+        except (TypeError, ValueError):
+            return None
+        num_idx = len(num_fields)
+        num_fields.append(fid)
+        num_ops.append(opc)
+        num_thresholds.append(threshold)
+        return num_idx
+
+    def _pack_categorical_rule(self, field_lower, op_code, expected_value, expected_norm):
+        """Encode a categorical membership rule as (slot, mask, negate).
+
+        Only exact string-equality membership packs: `in`/`not_in` with a
+        list constant on a scalar string field, `equals` on a scalar string
+        field, and `any_in` with a list constant on a list-of-strings field.
+        Substring operators keep the general comparison. Returns None when
+        the rule doesn't qualify.
+        """
+        if op_code in (6, 7):
+            if (field_lower not in self.SCALAR_CAT_FIELDS
+                    or not isinstance(expected_value, list)
+                    or not all(isinstance(v, str) for v in expected_value)):
+                return None
+            values = expected_value
+            negate = op_code == 7
+        elif op_code == 10:
+            if field_lower not in self.SCALAR_CAT_FIELDS:
+                return None
+            values = [expected_norm]
+            negate = False
+        elif op_code == 9:
+            if (field_lower not in self.LIST_CAT_FIELDS
+                    or not isinstance(expected_value, list)
+                    or not all(isinstance(v, str) for v in expected_value)):
+                return None
+            values = expected_value
+            negate = False
+        else:
+            return None
+
+        slot = self._cat_slots.setdefault(field_lower, len(self._cat_slots))
+        if slot == len(self._cat_registries):
+            self._cat_registries.append({})
+        registry = self._cat_registries[slot]
+        mask = 0
+        for value in values:
+            bit = registry.get(value)
+            if bit is None:
+                bit = 1 << len(registry)
+                registry[value] = bit
+            mask |= bit
+        return slot, mask, negate
+
+    def _categorical_bits(self, profile_values: Dict[str, Any]) -> Optional[List[int]]:
+        """Profile-side bit patterns for every packed categorical field."""
+        if not self._cat_slots:
+            return None
+        bits = [0] * len(self._cat_registries)
+        for field_lower, slot in self._cat_slots.items():
+            value = profile_values.get(field_lower)
+            registry = self._cat_registries[slot]
+            if isinstance(value, list):
+                pattern = 0
+                for item in value:
+                    pattern |= registry.get(item, 0)
+                bits[slot] = pattern
+            elif value is not None:
+                bits[slot] = registry.get(value, 0)
+        return bits
+
+    def _numeric_rule_verdicts(self, profile: FarmerProfile):
+        """Evaluate every packed numeric rule against the profile at once."""
+        if self._num_ops.size == 0:
+            return None
+        vec = np.array([
+            float(profile.acreage),
+            float(profile.annual_income),
+            float(profile.family_count),
+        ], dtype=np.float64)
+        actual = vec[self._num_field_idx]
+        t = self._num_thresholds
+        return np.choose(self._num_ops, [
+            actual == t, actual != t,
+            actual < t, actual <= t,
+            actual > t, actual >= t,
+        ])
+
+    def scheme_summaries(self) -> Dict:
+        """Cached summary payload for scheme listings; rebuilt on reload."""
+        if self._summary_cache is None:
+            self._summary_cache = {
+                "total": len(self.schemes),
+                "schemes": [
+                    {
+                        "scheme_id": s.get("scheme_id"),
+                        "name": s.get("name"),
+                        "name_hi": s.get("name_hi"),
+                        "name_mr": s.get("name_mr"),
+                        "category": s.get("category"),
+                        "max_benefit": s.get("max_benefit"),
+                        "description": s.get("description")
+                    }
+                    for s in self.schemes
+                ]
+            }
+        return self._summary_cache
     
     def _load_schemes_from_db(self) -> List[Dict]:
-        """Load scheme definitions from PostgreSQL."""
+        """Load scheme definitions from PostgreSQL.
+
+        Loads within the TTL reuse the last result outright; after it, a
+        max(updated_at) probe decides whether the full SELECT and row
+        conversion can be skipped because the catalogue hasn't changed.
+        Connections come from the shared pool.
+        """
+        now = time.monotonic()
+        if (self._db_cache is not None
+                and now - self._db_cache_time < self.DB_CACHE_TTL_SECONDS):
+            return self._db_cache
+
+        conn = None
         try:
-            conn = psycopg2.connect(settings.database_url)
+            conn = _get_db_connection()
             cur = conn.cursor(cursor_factory=RealDictCursor)
+
+            cur.execute("SELECT max(updated_at) AS stamp FROM schemes")
+            row = cur.fetchone()
+            stamp = row['stamp'] if row else None
+            if (self._db_cache is not None and stamp is not None
+                    and stamp == self._db_cache_stamp):
+                self._db_cache_time = now
+                cur.close()
+                return self._db_cache
+
             cur.execute("SELECT * FROM schemes WHERE is_active = TRUE")
             rows = cur.fetchall()
-            
+
             schemes = []
             for row in rows:
                 scheme = dict(row)
@@ -67,24 +665,28 @@ class RulesEngine:
                     scheme['rules'] = json.loads(scheme['eligibility_rules'])
                 else:
                     scheme['rules'] = scheme['eligibility_rules']
-                
+
                 # Ensure compatibility with existing logic
                 scheme['max_benefit'] = float(scheme.get('benefit_estimate') or 0)
                 schemes.append(scheme)
-            
+
             cur.close()
-            conn.close()
+            self._db_cache = schemes
+            self._db_cache_stamp = stamp
+            self._db_cache_time = now
             return schemes
         except Exception as e:
             logger.error(f"Error loading schemes from DB: {e}")
             return []
+        finally:
+            if conn is not None:
+                _release_db_connection(conn)
 
     def _load_schemes_from_yaml(self) -> List[Dict]:
         """Load scheme definitions from YAML file."""
         try:
-            with open(self.schemes_path, 'r', encoding='utf-8') as f:
-                data = yaml.safe_load(f)
-                return data.get('schemes', [])
+            mtime = os.path.getmtime(self.schemes_path)
+            return list(_parse_schemes_yaml(self.schemes_path, mtime))
         except FileNotFoundError:
             logger.warning(f"Schemes file not found at {self.schemes_path}, using empty list")
             return []
@@ -92,33 +694,14 @@ class RulesEngine:
             logger.error(f"Error loading schemes: {e}")
             return []
     
+    def _profile_values(self, profile: FarmerProfile) -> Dict[str, Any]:
+        """Build the field-name-to-value mapping for a profile once."""
+        return {field: getter(profile) for field, getter in _FIELD_GETTERS.items()}
+
     def _get_profile_value(self, profile: FarmerProfile, field: str) -> Any:
         """Extract a value from the profile by field name."""
-        field_mapping = {
-            "acreage": profile.acreage,
-            "land_area": profile.acreage,
-            "income": profile.annual_income,
-            "annual_income": profile.annual_income,
-            "family_count": profile.family_count,
-            "family_size": profile.family_count,
-            "state": profile.state.lower(),
-            "district": profile.district.lower(),
-            "land_type": profile.land_type.value,
-            "farmer_type": profile.farmer_type.value,
-            "crops": profile.main_crops,
-            "main_crops": profile.main_crops,
-            "education_level": profile.education_level.lower() if profile.education_level else "none",
-            "irrigation_available": profile.irrigation_available,
-            "loan_status": profile.loan_status.lower() if profile.loan_status else "none",
-            "bank_account_linked": profile.bank_account_linked,
-            "aadhaar_linked": profile.aadhaar_linked,
-            "caste_category": profile.caste_category.lower() if profile.caste_category else "general",
-            "livestock": profile.livestock,
-            "soil_type": profile.soil_type.lower() if profile.soil_type else "unknown",
-            "water_source": profile.water_source.lower() if profile.water_source else "rainfed",
-            "machinery_owned": profile.machinery_owned,
-        }
-        return field_mapping.get(field.lower())
+        getter = _FIELD_GETTERS.get(field.lower())
+        return getter(profile) if getter is not None else None
     
     def _evaluate_rule(self, rule: Dict, profile: FarmerProfile) -> RuleMatch:
         """Evaluate a single rule against a profile."""
@@ -129,10 +712,12 @@ class RulesEngine:
         description = rule.get('description', f"{field} {operator} {expected_value}")
         
         actual_value = self._get_profile_value(profile, field)
-        
+
+        # RuleMatch instances here are built from engine-typed data, so the
+        # unvalidated constructor skips pydantic's per-field validation pass
         # Handle None values
         if actual_value is None:
-            return RuleMatch(
+            return RuleMatch.model_construct(
                 rule_id=rule_id,
                 field=field,
                 operator=operator,
@@ -142,11 +727,11 @@ class RulesEngine:
                 description=f"Field '{field}' not found in profile"
             )
         
-        # Get operator function
-        op_func = self.OPERATORS.get(operator)
-        if not op_func:
+        # Resolve the operator id
+        op_code = OP_CODES.get(operator)
+        if op_code is None:
             logger.warning(f"Unknown operator: {operator}")
-            return RuleMatch(
+            return RuleMatch.model_construct(
                 rule_id=rule_id,
                 field=field,
                 operator=operator,
@@ -157,12 +742,15 @@ class RulesEngine:
             )
         
         try:
-            passed = op_func(actual_value, expected_value)
+            passed = _apply_op(
+                op_code, actual_value,
+                _normalize_expected(op_code, expected_value)
+            )
         except Exception as e:
             logger.warning(f"Error evaluating rule {rule_id}: {e}")
             passed = False
         
-        return RuleMatch(
+        return RuleMatch.model_construct(
             rule_id=rule_id,
             field=field,
             operator=operator,
@@ -173,98 +761,471 @@ class RulesEngine:
         )
     
     def _evaluate_condition_group(
-        self, 
-        conditions: List[Dict], 
+        self,
+        conditions: List[Dict],
         profile: FarmerProfile,
-        logic: str = "AND"
+        logic: str = "AND",
+        full_diagnostics: bool = True,
+        collect_evidence: bool = True
     ) -> Tuple[bool, List[RuleMatch], List[RuleMatch]]:
-        """Evaluate a group of conditions with AND/OR logic."""
+        """Evaluate a group of conditions with AND/OR logic.
+
+        With `full_diagnostics=False`, groups bail as soon as the verdict is
+        decided — an AND group at its first failing rule, an OR group at its
+        first passing one — so callers that only need the verdict skip the
+        remaining evaluations and get truncated rule lists. With
+        `collect_evidence=False` no RuleMatch objects are built at all and
+        the rule lists come back empty.
+        """
+        if not collect_evidence:
+            is_and = logic.upper() == "AND"
+            for condition in conditions:
+                if 'conditions' in condition:
+                    passed = self._evaluate_condition_group(
+                        condition['conditions'], profile,
+                        condition.get('logic', 'AND'), False, False
+                    )[0]
+                else:
+                    passed = self._evaluate_rule(condition, profile).passed
+                if is_and and not passed:
+                    return False, [], []
+                if not is_and and passed:
+                    return True, [], []
+            return is_and, [], []
+
         matched_rules = []
         failing_rules = []
-        
+        is_and = logic.upper() == "AND"
+        short_circuit = is_and and not full_diagnostics
+        or_short_circuit = not is_and and not full_diagnostics
+
         for condition in conditions:
             # Check for nested groups
             if 'conditions' in condition:
                 nested_logic = condition.get('logic', 'AND')
                 nested_pass, nested_matched, nested_failed = self._evaluate_condition_group(
-                    condition['conditions'], profile, nested_logic
+                    condition['conditions'], profile, nested_logic, full_diagnostics
                 )
                 if nested_pass:
                     matched_rules.extend(nested_matched)
+                    if or_short_circuit:
+                        return True, matched_rules, failing_rules
                 else:
                     failing_rules.extend(nested_failed)
+                    if short_circuit:
+                        return False, matched_rules, failing_rules
             else:
                 # Regular rule
                 result = self._evaluate_rule(condition, profile)
                 if result.passed:
                     matched_rules.append(result)
+                    if or_short_circuit:
+                        return True, matched_rules, failing_rules
                 else:
                     failing_rules.append(result)
-        
+                    if short_circuit:
+                        return False, matched_rules, failing_rules
+
         # Determine overall pass based on logic
-        if logic.upper() == "AND":
+        if is_and:
             passed = len(failing_rules) == 0
         else:  # OR
             passed = len(matched_rules) > 0
-        
+
         return passed, matched_rules, failing_rules
     
+    def _evaluate_compiled(
+        self,
+        compiled: List[Tuple],
+        profile_values: Dict[str, Any],
+        logic: str,
+        numeric_verdicts=None,
+        cat_bits: Optional[List[int]] = None,
+        full_diagnostics: bool = True,
+        predicate_memo: Optional[Dict[Tuple, bool]] = None,
+        collect_evidence: bool = True
+    ) -> Tuple[bool, List[RuleMatch], List[RuleMatch]]:
+        """Evaluate pre-resolved flat rules; mirrors _evaluate_condition_group."""
+        is_and = logic.upper() == "AND"
+
+        if not collect_evidence:
+            # Verdict only: no RuleMatch clones, bail as soon as it's decided
+            for field_lower, op_code, expected_norm, rule_id, num_idx, cat, fingerprint, template, missing in compiled:
+                actual_value = profile_values.get(field_lower)
+                if actual_value is None:
+                    passed = False
+                elif num_idx is not None and numeric_verdicts is not None:
+                    passed = bool(numeric_verdicts[num_idx])
+                elif cat is not None and cat_bits is not None:
+                    slot, mask, negate = cat
+                    passed = ((cat_bits[slot] & mask) != 0) != negate
+                elif (predicate_memo is not None and fingerprint is not None
+                        and fingerprint in predicate_memo):
+                    passed = predicate_memo[fingerprint]
+                else:
+                    try:
+                        passed = _apply_op(op_code, actual_value, expected_norm)
+                    except Exception as e:
+                        logger.warning(f"Error evaluating rule {rule_id}: {e}")
+                        passed = False
+                    if predicate_memo is not None and fingerprint is not None:
+                        predicate_memo[fingerprint] = passed
+                if is_and and not passed:
+                    return False, [], []
+                if not is_and and passed:
+                    return True, [], []
+            return is_and, [], []
+
+        matched_rules = []
+        failing_rules = []
+        short_circuit = is_and and not full_diagnostics
+        or_short_circuit = not is_and and not full_diagnostics
+
+        for field_lower, op_code, expected_norm, rule_id, num_idx, cat, fingerprint, template, missing in compiled:
+            actual_value = profile_values.get(field_lower)
+
+            if actual_value is None:
+                failing_rules.append(missing)
+                if short_circuit:
+                    return False, matched_rules, failing_rules
+                continue
+
+            if num_idx is not None and numeric_verdicts is not None:
+                # Comparison already done in the vectorized pass
+                passed = bool(numeric_verdicts[num_idx])
+            elif cat is not None and cat_bits is not None:
+                # Membership collapses to one bitwise AND
+                slot, mask, negate = cat
+                passed = ((cat_bits[slot] & mask) != 0) != negate
+            elif (predicate_memo is not None and fingerprint is not None
+                    and fingerprint in predicate_memo):
+                passed = predicate_memo[fingerprint]
+            else:
+                try:
+                    passed = _apply_op(op_code, actual_value, expected_norm)
+                except Exception as e:
+                    logger.warning(f"Error evaluating rule {rule_id}: {e}")
+                    passed = False
+                if predicate_memo is not None and fingerprint is not None:
+                    predicate_memo[fingerprint] = passed
+
+            result = template.model_copy(
+                update={'actual_value': actual_value, 'passed': passed}
+            )
+            if passed:
+                matched_rules.append(result)
+                if or_short_circuit:
+                    return True, matched_rules, failing_rules
+            else:
+                failing_rules.append(result)
+                if short_circuit:
+                    return False, matched_rules, failing_rules
+
+        if is_and:
+            group_passed = len(failing_rules) == 0
+        else:  # OR
+            group_passed = len(matched_rules) > 0
+
+        return group_passed, matched_rules, failing_rules
+
     def evaluate_scheme(
         self, 
-        scheme: Dict, 
-        profile: FarmerProfile
+        scheme: Dict,
+        profile: FarmerProfile,
+        profile_values: Optional[Dict[str, Any]] = None,
+        numeric_verdicts=None,
+        cat_bits: Optional[List[int]] = None,
+        full_diagnostics: bool = True,
+        predicate_memo: Optional[Dict[Tuple, bool]] = None,
+        eligibility_only: bool = False
     ) -> Tuple[bool, List[RuleMatch], List[RuleMatch], float]:
         """
         Evaluate a scheme's rules against a profile.
         Returns: (is_eligible, matched_rules, failing_rules, confidence)
+
+        `profile_values` lets callers evaluating many schemes share one
+        field-to-value mapping instead of rebuilding it per scheme. With
+        `full_diagnostics=False`, evaluation stops as soon as the verdict is
+        decided (AND at its first failing rule, OR at its first passing one)
+        and reports a flat confidence — only for callers that need the
+        verdict, not the complete rule lists. `eligibility_only=True` goes
+        further: no RuleMatch objects are built at all, the rule lists come
+        back empty and confidence is flat 1.0/0.0.
         """
         rules = scheme.get('rules', [])
         logic = scheme.get('rules_logic', 'AND')
-        
+
         if not rules:
             return True, [], [], 1.0
-        
-        passed, matched_rules, failing_rules = self._evaluate_condition_group(
-            rules, profile, logic
-        )
-        
+
+        if eligibility_only:
+            full_diagnostics = False
+
+        compiled = self._compiled_by_id.get(id(scheme))
+        if compiled is not None:
+            if profile_values is None:
+                profile_values = self._profile_values(profile)
+            passed, matched_rules, failing_rules = self._evaluate_compiled(
+                compiled, profile_values, logic, numeric_verdicts, cat_bits,
+                full_diagnostics, predicate_memo, not eligibility_only
+            )
+        else:
+            passed, matched_rules, failing_rules = self._evaluate_condition_group(
+                rules, profile, logic, full_diagnostics, not eligibility_only
+            )
+
+        if eligibility_only:
+            return passed, [], [], 1.0 if passed else 0.0
+
+        # Short-circuited evaluations have truncated rule lists, so the
+        # match ratio would be meaningless; decided verdicts carry a flat
+        # confidence instead (0.0 for AND failures, 1.0 for OR successes)
+        if not full_diagnostics:
+            if not passed:
+                return passed, matched_rules, failing_rules, 0.0
+            if str(logic).upper() != "AND":
+                return passed, matched_rules, failing_rules, 1.0
+
         # Calculate confidence based on rule match ratio
         total_rules = len(matched_rules) + len(failing_rules)
         if total_rules > 0:
             confidence = len(matched_rules) / total_rules
         else:
             confidence = 1.0
-        
+
         return passed, matched_rules, failing_rules, confidence
-    
+
+    def explain_scheme(
+        self,
+        scheme: Dict,
+        profile: FarmerProfile
+    ) -> Tuple[bool, List[RuleMatch], List[RuleMatch], float]:
+        """Full-evidence evaluation for UI explanations.
+
+        Always walks every rule and returns the complete matched and
+        failing lists — the slow counterpart to the eligibility_only path.
+        """
+        return self.evaluate_scheme(scheme, profile)
+
     def find_eligible_schemes(
-        self, 
+        self,
         profile: FarmerProfile,
-        schemes: Optional[List[Dict[str, Any]]] = None
-    ) -> List[Dict[str, Any]]:
+        schemes: Optional[List[Dict[str, Any]]] = None,
+        full_diagnostics: bool = True,
+        eligibility_only: bool = False
+    ) -> List[EligibilityResult]:
         """
         Find all schemes the profile is eligible for.
-        Returns list of dicts with scheme info and rule evaluation results.
+        Returns one EligibilityResult per evaluated scheme.
+
+        `full_diagnostics=False` short-circuits AND schemes at their first
+        failing rule — use it only when the caller needs verdicts, since the
+        ranking pipeline scores partially eligible schemes from the complete
+        failure list. `eligibility_only=True` returns only the eligible
+        schemes, with empty rule lists: ineligible schemes are decided and
+        dropped without allocating a single RuleMatch.
         """
         results = []
         schemes_to_eval = schemes if schemes is not None else self.schemes
-        
-        for scheme in schemes_to_eval:
-            is_eligible, matched, failing, confidence = self.evaluate_scheme(scheme, profile)
-            
-            results.append({
-                "scheme": scheme,
-                "is_eligible": is_eligible,
-                "matched_rules": matched,
-                "failing_rules": failing,
-                "confidence": confidence
-            })
-        
+
+        # Identical profiles repeat across requests (retries, suggestion
+        # clicks), so results for the engine's own schemes are memoized.
+        # Request-supplied schemes share ids with different rules and are
+        # never cached.
+        use_cache = schemes is None
+        profile_values = self._profile_values(profile)
+        # All packed numeric comparisons for this profile in one shot,
+        # plus the profile's bit patterns for categorical membership rules
+        numeric_verdicts = self._numeric_rule_verdicts(profile)
+        cat_bits = self._categorical_bits(profile_values)
+        # Verdicts for predicates shared between schemes, scoped to this call
+        predicate_memo: Dict[Tuple, bool] = {}
+        if use_cache:
+            profile_key = profile.model_dump_json()
+            # O(log S) per threshold bucket; every scheme in the mapping has
+            # a decisive failing numeric bound attached
+            numeric_skip = self._numeric_disqualified(profile)
+
+        for pos, scheme in enumerate(schemes_to_eval):
+            if use_cache:
+                # Hard prefilters: a failing top-level state rule or numeric
+                # bound under AND logic already decides ineligibility, so
+                # the scheme's remaining rules never need evaluating. Gated
+                # schemes still appear in the results as ineligible, with
+                # the decisive rule as their single failing entry.
+                gate_failure = numeric_skip.get(pos)
+                hard_rule = self._hard_state_rules.get(pos) if gate_failure is None else None
+                if hard_rule is not None:
+                    op_code, expected_norm, template = hard_rule
+                    actual = profile_values.get('state')
+                    try:
+                        if (op_code is None or actual is None
+                                or not _apply_op(op_code, actual, expected_norm)):
+                            gate_failure = ('state', template)
+                    except Exception:
+                        gate_failure = ('state', template)
+                if gate_failure is None:
+                    quick = self._quick_rejects.get(pos)
+                    if quick is not None:
+                        field_lower, op_code, expected_norm, template = quick
+                        actual = profile_values.get(field_lower)
+                        try:
+                            if (actual is None
+                                    or not _apply_op(op_code, actual, expected_norm)):
+                                gate_failure = (field_lower, template)
+                        except Exception:
+                            gate_failure = (field_lower, template)
+                if gate_failure is not None:
+                    if not eligibility_only:
+                        field_lower, template = gate_failure
+                        results.append(EligibilityResult(
+                            scheme=scheme,
+                            is_eligible=False,
+                            matched_rules=[],
+                            failing_rules=[template.model_copy(
+                                update={'actual_value': profile_values.get(field_lower)}
+                            )],
+                            confidence=0.0
+                        ))
+                    continue
+
+                # Truncated and full evaluations must not share entries
+                cache_key = (scheme.get('scheme_id'), profile_key,
+                             full_diagnostics, eligibility_only)
+                evaluation = self._eval_cache.get(cache_key)
+                if evaluation is None:
+                    evaluation = self.evaluate_scheme(
+                        scheme, profile, profile_values, numeric_verdicts,
+                        cat_bits, full_diagnostics, predicate_memo,
+                        eligibility_only
+                    )
+                    if len(self._eval_cache) >= self.EVAL_CACHE_MAX_ENTRIES:
+                        self._eval_cache.clear()
+                    self._eval_cache[cache_key] = evaluation
+                is_eligible, matched, failing, confidence = evaluation
+            else:
+                is_eligible, matched, failing, confidence = self.evaluate_scheme(
+                    scheme, profile, profile_values, numeric_verdicts,
+                    cat_bits, full_diagnostics, predicate_memo,
+                    eligibility_only
+                )
+
+            if eligibility_only and not is_eligible:
+                continue
+
+            results.append(EligibilityResult(
+                scheme=scheme,
+                is_eligible=is_eligible,
+                matched_rules=matched,
+                failing_rules=failing,
+                confidence=confidence
+            ))
+
         return results
     
+    def __getstate__(self):
+        """Pickle only the loaded schemes and source path.
+
+        The compiled rule tables key on scheme object ids and the eval/DB
+        caches hold process-local state, so none of it survives a pickle
+        round trip; a worker rebuilds them from the scheme list instead of
+        re-paying the DB/YAML load.
+        """
+        return {'schemes_path': self.schemes_path, 'schemes': self.schemes}
+
+    def __setstate__(self, state):
+        self.schemes_path = state['schemes_path']
+        self.schemes = state['schemes']
+        self._summary_cache = None
+        self._eval_cache = {}
+        self._db_cache = None
+        self._db_cache_stamp = None
+        self._db_cache_time = 0.0
+        self._build_hard_filters()
+        self._build_numeric_prefilters()
+        self._build_quick_rejects()
+        self._compile_rules()
+        self._schemes_by_id = {
+            s['scheme_id']: s for s in self.schemes if s.get('scheme_id')
+        }
+
+    def evaluate_batch(self, profiles: List[FarmerProfile]) -> np.ndarray:
+        """Eligibility verdicts for many profiles against the full catalogue.
+
+        Returns an (N, M) boolean array aligned with `profiles` and
+        `self.schemes`. Rules covered by the packed numeric and categorical
+        forms evaluate as whole-column array operations across all profiles
+        at once; schemes with any other rule fall back to the scalar
+        verdict-only evaluator per profile. No RuleMatch diagnostics are
+        built — this is the bulk path for accuracy runs and batch scoring.
+        """
+        n, m = len(profiles), len(self.schemes)
+        out = np.zeros((n, m), dtype=bool)
+        if n == 0 or m == 0:
+            return out
+
+        profile_values_list = [self._profile_values(p) for p in profiles]
+
+        # (N, R) verdicts for every packed numeric rule
+        num_verdicts = None
+        if self._num_ops.size:
+            values = np.array(
+                [[float(p.acreage), float(p.annual_income), float(p.family_count)]
+                 for p in profiles], dtype=np.float64)
+            actual = values[:, self._num_field_idx]
+            t = self._num_thresholds
+            num_verdicts = np.choose(self._num_ops, [
+                actual == t, actual != t,
+                actual < t, actual <= t,
+                actual > t, actual >= t,
+            ])
+
+        # (N, S) profile bit patterns; int64 columns only work while every
+        # registry stays under 64 bits, otherwise those rules go scalar
+        cat_bits_list = [self._categorical_bits(pv) for pv in profile_values_list]
+        cat_matrix = None
+        if self._cat_slots and all(len(r) < 64 for r in self._cat_registries):
+            cat_matrix = np.array(cat_bits_list, dtype=np.int64)
+
+        for j, scheme in enumerate(self.schemes):
+            rules = scheme.get('rules', [])
+            if not rules:
+                out[:, j] = True
+                continue
+
+            compiled = self._compiled_by_id.get(id(scheme))
+            columns = None
+            if compiled is not None:
+                columns = []
+                for rule in compiled:
+                    num_idx, cat = rule[4], rule[5]
+                    if num_idx is not None and num_verdicts is not None:
+                        columns.append(num_verdicts[:, num_idx])
+                    elif cat is not None and cat_matrix is not None:
+                        slot, mask, negate = cat
+                        col = (cat_matrix[:, slot] & mask) != 0
+                        columns.append(~col if negate else col)
+                    else:
+                        columns = None
+                        break
+
+            if columns is not None:
+                if str(scheme.get('rules_logic', 'AND')).upper() == 'AND':
+                    out[:, j] = np.logical_and.reduce(columns)
+                else:
+                    out[:, j] = np.logical_or.reduce(columns)
+                continue
+
+            # Scalar fallback for schemes with unpacked rules
+            for i, profile in enumerate(profiles):
+                out[i, j] = self.evaluate_scheme(
+                    scheme, profile, profile_values_list[i],
+                    num_verdicts[i] if num_verdicts is not None else None,
+                    cat_bits_list[i], False
+                )[0]
+
+        return out
+
     def get_scheme_by_id(self, scheme_id: str) -> Dict:
-        """Get a scheme by its ID."""
-        for scheme in self.schemes:
-            if scheme.get('scheme_id') == scheme_id:
-                return scheme
-        return None
+        """Get a scheme by its ID; O(1) via the index built on reload."""
+        return self._schemes_by_id.get(scheme_id)
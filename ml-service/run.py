@@ -0,0 +1,20 @@
+"""
+Production entrypoint: multi-worker uvicorn.
+
+Worker count defaults to the CPU count so the CPU-bound scheme matching
+and OCR endpoints scale across cores; override with WEB_CONCURRENCY.
+The loop/http implementations are left on "auto" so uvicorn picks up
+uvloop and httptools when they are installed.
+"""
+
+import os
+import uvicorn
+
+if __name__ == "__main__":
+    uvicorn.run(
+        "app.main:app",
+        host="0.0.0.0",
+        port=int(os.environ.get("PORT", 5000)),
+        workers=int(os.environ.get("WEB_CONCURRENCY", os.cpu_count() or 1)),
+        log_level="info",
+    )
@@ -6,6 +6,8 @@ import random
 import json
 from typing import List, Dict, Any
 
+import numpy as np
+
 STATES = ["maharashtra", "uttar_pradesh", "madhya_pradesh", "rajasthan", "karnataka", 
           "gujarat", "punjab", "haryana", "bihar", "west_bengal", "andhra_pradesh",
           "tamil_nadu", "telangana", "odisha", "kerala"]
@@ -156,9 +158,69 @@ def determine_expected_schemes(profile: Dict[str, Any]) -> List[str]:
 
 
 def generate_all_profiles(count: int = 300) -> List[Dict[str, Any]]:
-    """Generate specified number of synthetic profiles."""
-    random.seed(42)  # For reproducibility
-    return [generate_profile(i + 1) for i in range(count)]
+    """Generate specified number of synthetic profiles.
+
+    All random draws happen as seeded NumPy array operations — one call
+    per attribute for the whole batch instead of several Python-level
+    random.* calls per profile. A single comprehension then zips the
+    arrays into the same dict shape generate_profile produces.
+    """
+    rng = np.random.default_rng(42)  # For reproducibility
+
+    genders = rng.choice(GENDERS, count)
+    states = rng.choice(STATES, count)
+    district_idx = rng.integers(0, min(len(d) for d in DISTRICTS.values()), count)
+    acreages = np.round(rng.triangular(0.5, 2, 10, count), 1)
+    incomes = rng.choice([50000, 80000, 100000, 120000, 150000,
+                          200000, 250000, 300000], count)
+    ages = rng.integers(22, 71, count)
+    family_counts = rng.integers(2, 9, count)
+    land_types = rng.choice(LAND_TYPES, count)
+    farmer_types = rng.choice(FARMER_TYPES, count)
+    categories = rng.choice(CATEGORIES, count)
+    mobiles = rng.integers(100000000, 1000000000, count)
+
+    # Distinct crops per profile: each row of crop_order is a random
+    # permutation prefix, sliced to that profile's crop count
+    num_crops = np.minimum(rng.integers(1, 4, count), acreages.astype(int) + 1)
+    crop_order = np.argsort(rng.random((count, len(CROPS))), axis=1)
+
+    male_idx = rng.integers(0, len(FIRST_NAMES_MALE), count)
+    female_idx = rng.integers(0, len(FIRST_NAMES_FEMALE), count)
+    last_idx = rng.integers(0, len(LAST_NAMES), count)
+
+    flags = rng.random((count, 5))
+
+    profiles = []
+    for i in range(count):
+        gender = str(genders[i])
+        first_name = (FIRST_NAMES_MALE[male_idx[i]] if gender == "male"
+                      else FIRST_NAMES_FEMALE[female_idx[i]])
+        state = str(states[i])
+        profile = {
+            "profile_id": f"FARMER_{i + 1:04d}",
+            "name": f"{first_name} {LAST_NAMES[last_idx[i]]}",
+            "mobile": f"9{mobiles[i]}",
+            "gender": gender,
+            "age": int(ages[i]),
+            "category": str(categories[i]),
+            "state": state,
+            "district": DISTRICTS[state][district_idx[i]],
+            "land_type": str(land_types[i]),
+            "acreage": float(acreages[i]),
+            "main_crops": [CROPS[c] for c in crop_order[i, :num_crops[i]]],
+            "farmer_type": str(farmer_types[i]),
+            "family_count": int(family_counts[i]),
+            "annual_income": int(incomes[i]),
+            "has_bank_account": bool(flags[i, 0] > 0.1),  # 90% have bank accounts
+            "has_kcc": bool(flags[i, 1] > 0.6),  # 40% have KCC
+            "has_soil_health_card": bool(flags[i, 2] > 0.7),  # 30% have SHC
+            "is_drought_affected": bool(flags[i, 3] > 0.8),  # 20% drought affected
+            "is_flood_affected": bool(flags[i, 4] > 0.9),  # 10% flood affected
+        }
+        profile["expected_schemes"] = determine_expected_schemes(profile)
+        profiles.append(profile)
+    return profiles
 
 
 def save_profiles(profiles: List[Dict[str, Any]], filepath: str):
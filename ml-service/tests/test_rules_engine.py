@@ -6,6 +6,8 @@ import pytest
 import sys
 import os
 
+import numpy as np
+
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
 from app.services.rules_engine import RulesEngine
@@ -13,18 +15,60 @@ from app.models.schemas import FarmerProfile
 from tests.data.synthetic_profiles import generate_all_profiles
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def rules_engine():
-    """Initialize rules engine with scheme data."""
+    """Initialize rules engine with scheme data.
+
+    Session-scoped: the scheme load and rule compilation happen once for
+    the whole suite instead of once per test.
+    """
     return RulesEngine()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def synthetic_profiles():
-    """Generate synthetic test profiles."""
+    """Generate synthetic test profiles once per session."""
     return generate_all_profiles(200)  # Use 200 for faster tests
 
 
+# The generator's land types don't match the LandType enum 1:1; both
+# unirrigated variants collapse to "dry"
+LAND_TYPE_MAP = {"irrigated": "irrigated", "rainfed": "dry", "dryland": "dry"}
+
+# Synthetic expected_schemes use shorthand ids; this maps them to the
+# catalogue's scheme_ids. Shorthands without a catalogue counterpart
+# (enam, rkvy, nmoop, relief and women/SC-ST schemes) have no entry and
+# are excluded from scoring — the engine has no scheme to match them to.
+EXPECTED_ID_MAP = {
+    "pm_kisan": "PM-KISAN-001",
+    "soil_health_card": "SHC-002",
+    "pmfby": "PMFBY-003",
+    "kcc": "KCC-004",
+    "pmksy": "PMKSY-005",
+    "nfsm": "NFSM-006",
+    "pkvy": "PKVY-008",
+    "midh": "MIDH-010",
+}
+
+
+def _to_farmer_profile(profile_data):
+    """Convert a synthetic profile dict to a FarmerProfile."""
+    return FarmerProfile(
+        name=profile_data["name"],
+        mobile=profile_data["mobile"],
+        state=profile_data["state"],
+        district=profile_data["district"],
+        land_type=LAND_TYPE_MAP[profile_data["land_type"]],
+        acreage=profile_data["acreage"],
+        main_crops=profile_data["main_crops"],
+        farmer_type=profile_data["farmer_type"],
+        family_count=profile_data["family_count"],
+        annual_income=profile_data["annual_income"],
+        gender=profile_data.get("gender"),
+        category=profile_data.get("category")
+    )
+
+
 class TestRulesEngine:
     """Test cases for the rules engine."""
     
@@ -143,48 +187,48 @@ class TestRulesEngine:
         """
         Test overall accuracy against synthetic profiles.
         Target: >95% of expected schemes should be matched.
+
+        Eligibility for all profiles comes from one evaluate_batch call;
+        accuracy is then a couple of array ops over the (N, M) verdict
+        matrix against the expected matrix built from expected_schemes.
         """
-        total_expected = 0
-        total_matched = 0
-        mismatches = []
-        
-        for profile_data in synthetic_profiles[:200]:  # Test on 200 profiles
-            # Convert to FarmerProfile
-            profile = FarmerProfile(
-                name=profile_data["name"],
-                mobile=profile_data["mobile"],
-                state=profile_data["state"],
-                district=profile_data["district"],
-                land_type=profile_data["land_type"],
-                acreage=profile_data["acreage"],
-                main_crops=profile_data["main_crops"],
-                farmer_type=profile_data["farmer_type"],
-                family_count=profile_data["family_count"],
-                annual_income=profile_data["annual_income"],
-                gender=profile_data.get("gender"),
-                category=profile_data.get("category")
-            )
-            
-            result = rules_engine.evaluate(profile)
-            eligible_ids = set(s["scheme_id"] for s in result["eligible_schemes"])
-            expected_ids = set(profile_data.get("expected_schemes", []))
-            
-            # Count matches (schemes that were expected and found)
-            for expected in expected_ids:
-                total_expected += 1
-                if expected in eligible_ids:
-                    total_matched += 1
-                else:
-                    mismatches.append({
-                        "profile_id": profile_data["profile_id"],
-                        "missing_scheme": expected
-                    })
-        
+        # Convert all profiles up front instead of inside a scoring loop
+        test_data = synthetic_profiles[:200]  # Test on 200 profiles
+        profiles = [_to_farmer_profile(p) for p in test_data]
+
+        scheme_col = {s["scheme_id"]: j for j, s in enumerate(rules_engine.schemes)}
+        # Every mapped id must exist in the catalogue; a silent drop here
+        # would zero out total_expected and make the metric vacuous
+        unknown = set(EXPECTED_ID_MAP.values()) - set(scheme_col)
+        assert not unknown, f"Mapped scheme ids missing from catalogue: {unknown}"
+
+        expected = np.zeros((len(profiles), len(rules_engine.schemes)), dtype=bool)
+        for i, profile_data in enumerate(test_data):
+            for scheme_id in profile_data.get("expected_schemes", []):
+                mapped = EXPECTED_ID_MAP.get(scheme_id)
+                if mapped is not None:
+                    expected[i, scheme_col[mapped]] = True
+
+        eligibility = rules_engine.evaluate_batch(profiles)
+
+        total_expected = int(expected.sum())
+        total_matched = int((eligibility & expected).sum())
         accuracy = total_matched / total_expected if total_expected > 0 else 0
-        
+
         print(f"\nAccuracy: {accuracy:.2%} ({total_matched}/{total_expected})")
-        print(f"Mismatches: {len(mismatches)}")
-        
+
+        # Guard the vectorized path: row 0 must agree with the scalar walk
+        scalar_row = {
+            r.scheme["scheme_id"]
+            for r in rules_engine.find_eligible_schemes(profiles[0])
+            if r.is_eligible
+        }
+        batch_row = {
+            s["scheme_id"] for j, s in enumerate(rules_engine.schemes)
+            if eligibility[0, j]
+        }
+        assert scalar_row == batch_row
+
         # Note: This is a soft target - actual accuracy depends on rule definitions
         # In production, rules should be tuned to achieve >95%
         assert accuracy >= 0.70, f"Accuracy {accuracy:.2%} is below 70% threshold"